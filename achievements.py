@@ -0,0 +1,21 @@
+class AchievementRules:
+    """Achievement rules grouped by the state change that can unlock them.
+
+    Instead of re-checking every rule after each answer, the app emits an
+    event ("streak", "learned", ...) and only the rules registered for
+    that event are evaluated.
+    """
+
+    def __init__(self):
+        self.rules = {}
+
+    def on(self, event, name, check):
+        self.rules.setdefault(event, []).append((name, check))
+
+    def evaluate(self, event, state, unlocked):
+        """Names of rules for this event that newly pass for state."""
+        return [
+            name
+            for name, check in self.rules.get(event, ())
+            if name not in unlocked and check(state)
+        ]
@@ -0,0 +1,236 @@
+import random
+import threading
+from collections import deque
+
+# Smoothing for the error rate: every word starts as if it had been
+# answered PRIOR_STRENGTH times with the class-wide error rate.
+PRIOR_STRENGTH = 2.0
+DEFAULT_ERROR_RATE = 0.5
+# Answers slower than this (seconds) count as "hesitant" and raise the weight.
+SLOW_RESPONSE_SECONDS = 6.0
+MIN_WEIGHT = 0.05
+# Recent class-wide answers kept for learners to catch up on; a learner
+# that falls further behind recomputes all of its weights instead.
+CHANGE_LOG_SIZE = 1024
+
+
+# ---------------- Fenwick Tree ----------------
+class FenwickTree:
+    """Prefix sums over weights with O(log n) update and search."""
+
+    def __init__(self, capacity=16):
+        self.size = 0
+        self.tree = [0.0] * (capacity + 1)
+        self.values = [0.0] * capacity
+
+    def append(self, value):
+        if self.size == len(self.values):
+            self._grow()
+        self.size += 1
+        self.values[self.size - 1] = 0.0
+        self.update(self.size - 1, value)
+        return self.size - 1
+
+    def _grow(self):
+        # Rebuild at double capacity; amortised O(1) per append.
+        old = self.values[: self.size]
+        capacity = max(16, len(self.values) * 2)
+        self.tree = [0.0] * (capacity + 1)
+        self.values = old + [0.0] * (capacity - len(old))
+        # Linear-time build: every node passes its sum to its parent
+        for j in range(1, capacity + 1):
+            self.tree[j] += self.values[j - 1]
+            parent = j + (j & -j)
+            if parent <= capacity:
+                self.tree[parent] += self.tree[j]
+
+    def update(self, index, value):
+        delta = value - self.values[index]
+        self.values[index] = value
+        i = index + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def total(self):
+        s = 0.0
+        i = self.size
+        while i > 0:
+            s += self.tree[i]
+            i -= i & -i
+        return s
+
+    def find(self, target):
+        """Return the first index whose prefix sum exceeds target."""
+        pos = 0
+        step = 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(self.tree) and self.tree[nxt] <= target:
+                pos = nxt
+                target -= self.tree[nxt]
+            step >>= 1
+        return min(pos, self.size - 1)
+
+
+# ---------------- Word Statistics ----------------
+class WordStats:
+    """Running attempt counts and response times for one word."""
+
+    __slots__ = ("attempts", "errors", "total_time")
+
+    def __init__(self):
+        self.attempts = 0
+        self.errors = 0
+        self.total_time = 0.0
+
+    def record(self, correct, seconds=None):
+        self.attempts += 1
+        if not correct:
+            self.errors += 1
+        if seconds is not None:
+            self.total_time += max(0.0, seconds)
+
+    def error_rate(self, prior=DEFAULT_ERROR_RATE):
+        return (self.errors + prior * PRIOR_STRENGTH) / (self.attempts + PRIOR_STRENGTH)
+
+    def avg_time(self):
+        return self.total_time / self.attempts if self.attempts else 0.0
+
+
+# ---------------- Adaptive Sampler ----------------
+class AdaptiveSampler:
+    """Weighted word picker: words answered wrong (or slowly) come back more.
+
+    Weights live in a Fenwick tree, so adding a word, recording an answer
+    and drawing a word are all O(log n) in the number of tracked words.
+    A shared sampler passed as ``class_stats`` supplies the prior error
+    rate (excluding this learner's own answers) for words this learner has
+    not answered much yet. Class answers only append to a change log; each
+    learner catches up on it when it next draws, so answering costs the
+    same however many learners are active.
+    """
+
+    def __init__(self, class_stats=None):
+        self.class_stats = class_stats
+        self.index = {}
+        self.words = []
+        self.stats = []
+        self.weights = FenwickTree()
+        self.lock = threading.Lock()
+        self.changes = deque(maxlen=CHANGE_LOG_SIZE)
+        self.change_count = 0
+        self.class_cursor = class_stats.change_count if class_stats else 0
+
+    def __contains__(self, word):
+        return word in self.index
+
+    def __len__(self):
+        return len(self.words)
+
+    def add(self, word):
+        with self.lock:
+            if word in self.index:
+                return
+            self.index[word] = len(self.words)
+            self.words.append(word)
+            self.stats.append(WordStats())
+            self.weights.append(self._weight(len(self.words) - 1))
+
+    def record(self, word, correct, seconds=None):
+        """Record one answer and refresh that word's weight."""
+        self.add(word)
+        with self.lock:
+            i = self.index[word]
+            self.stats[i].record(correct, seconds)
+            self.weights.update(i, self._weight(i))
+            self.changes.append(word)
+            self.change_count += 1
+        if self.class_stats is not None:
+            self.class_stats.record(word, correct, seconds)
+
+    def changes_since(self, cursor):
+        """Words answered since cursor, or None if the log no longer reaches back."""
+        with self.lock:
+            behind = self.change_count - cursor
+            if behind > len(self.changes):
+                return None, self.change_count
+            recent = list(self.changes)[len(self.changes) - behind :] if behind else []
+            return set(recent), self.change_count
+
+    def refresh_class_prior(self):
+        """Catch up on class-wide answers recorded since the last refresh."""
+        if self.class_stats is None:
+            return
+        changed, cursor = self.class_stats.changes_since(self.class_cursor)
+        with self.lock:
+            self.class_cursor = cursor
+            if changed is None:
+                indexes = range(len(self.words))
+            else:
+                indexes = [self.index[w] for w in changed if w in self.index]
+            for i in indexes:
+                self.weights.update(i, self._weight(i))
+
+    def error_rate(self, word, exclude=None):
+        """Smoothed error rate, optionally leaving out one learner's answers."""
+        i = self.index.get(word)
+        attempts = self.stats[i].attempts if i is not None else 0
+        errors = self.stats[i].errors if i is not None else 0
+        if exclude is not None:
+            attempts = max(0, attempts - exclude.attempts)
+            errors = max(0, errors - exclude.errors)
+        return (errors + DEFAULT_ERROR_RATE * PRIOR_STRENGTH) / (
+            attempts + PRIOR_STRENGTH
+        )
+
+    def weight(self, word):
+        i = self.index.get(word)
+        return self.weights.values[i] if i is not None else self._prior_weight(word)
+
+    def _prior_weight(self, word):
+        prior = DEFAULT_ERROR_RATE
+        if self.class_stats is not None:
+            prior = self.class_stats.error_rate(word)
+        return MIN_WEIGHT + prior
+
+    def _weight(self, i):
+        word, s = self.words[i], self.stats[i]
+        prior = DEFAULT_ERROR_RATE
+        if self.class_stats is not None:
+            # Leave out this learner's own answers so they don't count twice
+            prior = self.class_stats.error_rate(word, exclude=s)
+        slowness = min(s.avg_time() / SLOW_RESPONSE_SECONDS, 2.0)
+        return MIN_WEIGHT + s.error_rate(prior) * (1.0 + slowness)
+
+    def draw(self):
+        """Draw one tracked word with probability proportional to its weight."""
+        self.refresh_class_prior()
+        with self.lock:
+            if not self.words:
+                return None
+            r = random.random() * self.weights.total()
+            return self.words[self.weights.find(r)]
+
+    def sample(self, pool, k):
+        """Pick up to k distinct words from pool, favouring high weights.
+
+        Cost depends only on the pool size (a quiz's worth of words), not on
+        the vocabulary or the number of recorded attempts.
+        """
+        self.refresh_class_prior()
+        pool = list(dict.fromkeys(pool))
+        tree = FenwickTree(len(pool))
+        for word in pool:
+            tree.append(self.weight(word))
+
+        picked = []
+        for _ in range(min(k, len(pool))):
+            r = random.random() * tree.total()
+            i = tree.find(r)
+            if tree.values[i] == 0.0:
+                # Float drift can land on an already-picked slot.
+                i = next(j for j, v in enumerate(tree.values[: tree.size]) if v > 0)
+            picked.append(pool[i])
+            tree.update(i, 0.0)
+        return picked
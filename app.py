@@ -1,6 +1,5 @@
 import streamlit as st
 import json
-from gtts import gTTS
 from io import BytesIO
 import base64
 import random
@@ -10,21 +9,94 @@ import os
 from typing import List, Dict
 import datetime
 import calendar
-import plotly.graph_objects as go
+import logging
+import re
+import uuid
+from achievements import AchievementRules
+from adaptive import AdaptiveSampler
+from bundle import BUNDLE_FILE, AssetBundle
+from leaderboard import LEADERBOARD_DB, Leaderboard
+from startup import lazy_import, start_warm_up
 
 
-# ---------------- Load word list ----------------
-with open("words.json", "r", encoding="utf-8") as f:
-    word_list = json.load(f)
+logger = logging.getLogger(__name__)
+
+
+# ---------------- Assets ----------------
+@st.cache_resource
+def load_bundle():
+    # Built by generate_json.py; fall back to loose files when it is missing
+    if not os.path.exists(BUNDLE_FILE):
+        return None
+    try:
+        bundle = AssetBundle(BUNDLE_FILE)
+    except (ValueError, OSError) as e:
+        logger.warning("Ignoring %s: %s", BUNDLE_FILE, e)
+        return None
+
+    stale = bundle.stale_paths()
+    if stale:
+        logger.warning(
+            "Ignoring %s: %d file(s) changed since it was built (e.g. %s). "
+            "Run generate_json.py to rebuild it.",
+            BUNDLE_FILE,
+            len(stale),
+            stale[0],
+        )
+        bundle.close()
+        return None
+    return bundle
+
 
-for w in word_list:
-    if "translation" not in w:
-        w["translation"] = ""
+def asset(path):
+    bundle = load_bundle()
+    if bundle is not None and path in bundle:
+        # Streamlit wants bytes, so copy the slice out of the map
+        return bundle.read(path).tobytes()
+    return path
+
+
+# ---------------- Load word list ----------------
+@st.cache_resource
+def load_word_list():
+    # Read once per process instead of on every rerun
+    with open("words.json", "r", encoding="utf-8") as f:
+        words = json.load(f)
+
+    for w in words:
+        if "translation" not in w:
+            w["translation"] = ""
+    return words
+
+
+@st.cache_resource
+def warm_up_assets():
+    # Heavy imports and asset reads happen off the request path
+    bundle = load_bundle()
+    if bundle is not None:
+        return start_warm_up(bundle=bundle)
+    paths = [w["image"] for w in word_list] + [
+        "sounds/bg_music.mp3",
+        "sounds/correct.mp3",
+        "sounds/wrong.mp3",
+    ]
+    return start_warm_up(paths)
+
+
+word_list = load_word_list()
+warm_up_assets()
 
 TOTAL_WORDS = len(word_list)
 WORDS_PER_ROUND = 3
 TOTAL_ROUNDS = max(1, TOTAL_WORDS // WORDS_PER_ROUND)
 DAILY_GOAL = 10
+DEFAULT_CLASS = "Everyone"
+LEADERBOARD_SIZE = 5
+LEADERBOARD_RETENTION_DAYS = 90
+NAME_MAX_LENGTH = 30
+LEARNER_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+# Kept across "Restart Game" so the learner keeps one leaderboard row
+IDENTITY_KEYS = ("learner_id", "player_name", "player_class")
 
 
 # ---------------- Session State Initialization ----------------
@@ -50,10 +122,35 @@ def init_state():
         "review_list": [],
         "daily_goal_celebrated": False,
         "daily_goal_completed": False,
+        "player_name": "",
+        "player_class": DEFAULT_CLASS,
     }
     for key, val in defaults.items():
         if key not in st.session_state:
             st.session_state[key] = val
+    if "learner_id" not in st.session_state:
+        st.session_state.learner_id = stored_learner_id()
+
+
+def stored_learner_id():
+    # Kept in the URL so a reload, which starts a new session, keeps the same row
+    learner_id = st.query_params.get("learner", "")
+    if not LEARNER_ID_PATTERN.fullmatch(learner_id):
+        learner_id = uuid.uuid4().hex
+        st.query_params["learner"] = learner_id
+    return learner_id
+
+
+# ---------------- Adaptive Word Selection ----------------
+@st.cache_resource
+def class_word_stats():
+    # Shared by every session in this process: class-wide error rates per word
+    return AdaptiveSampler()
+
+
+def record_answer(word, correct, shown_at=None):
+    seconds = time.time() - shown_at if shown_at else None
+    st.session_state.adaptive.record(word, correct, seconds)
 
 
 # ---------------- Calendar Functions ----------------
@@ -69,6 +166,7 @@ def show_calendar_visual():
     signed_in = [d.isoformat() in st.session_state.checkin_dates for d in dates]
     colors = ["lightgreen" if s else "lightgray" for s in signed_in]
 
+    go = lazy_import("plotly.graph_objects")
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
@@ -132,6 +230,9 @@ if st.session_state.daily_date != str(date.today()):
 if "checkin_dates" not in st.session_state:
     st.session_state.checkin_dates = set()
 
+if "adaptive" not in st.session_state:
+    st.session_state.adaptive = AdaptiveSampler(class_word_stats())
+
 if st.button("📅 Go to Check-In"):
     st.session_state.mode = "checkin"
     st.rerun()
@@ -145,11 +246,76 @@ bg_music_on = st.sidebar.checkbox("Background Music🎵", value=True)
 
 if bg_music_on:
     with st.sidebar:
-        st.audio("sounds/bg_music.mp3", format="audio/mp3", start_time=0)
+        st.audio(asset("sounds/bg_music.mp3"), format="audio/mp3", start_time=0)
+
+
+# ---------------- Leaderboard ----------------
+@st.cache_resource
+def load_leaderboard():
+    # One leaderboard for every session in this process
+    leaderboard = Leaderboard(LEADERBOARD_DB)
+    leaderboard.prune(LEADERBOARD_RETENTION_DAYS * 24 * 60 * 60)
+    return leaderboard
+
+
+def player_class():
+    return st.session_state.player_class.strip()[:NAME_MAX_LENGTH] or DEFAULT_CLASS
+
+
+def submit_score():
+    # Rows are keyed on learner_id, so renaming or changing class moves
+    # this learner's row; clearing the name takes them off the board
+    name = st.session_state.player_name.strip()[:NAME_MAX_LENGTH]
+    if name:
+        load_leaderboard().submit(
+            st.session_state.learner_id,
+            name,
+            player_class(),
+            st.session_state.high_score,
+            st.session_state.total_learned,
+        )
+    else:
+        load_leaderboard().remove(st.session_state.learner_id)
+
+
+with st.sidebar:
+    st.markdown("### 🏆 Class Leaderboard")
+    leaderboard = load_leaderboard()
+    if not st.session_state.player_name:
+        # Returning learner (same ID in the URL): fill in their name and class
+        saved = leaderboard.player(st.session_state.learner_id)
+        if saved is not None:
+            st.session_state.player_class, st.session_state.player_name = saved
+
+    st.text_input(
+        "Your name", key="player_name", max_chars=NAME_MAX_LENGTH, on_change=submit_score
+    )
+    st.text_input(
+        "Class", key="player_class", max_chars=NAME_MAX_LENGTH, on_change=submit_score
+    )
+
+    # Names are typed by learners, so show them as plain text, never markdown
+    for place, (name, best) in enumerate(
+        leaderboard.top(player_class(), LEADERBOARD_SIZE), start=1
+    ):
+        st.text(f"{place}. {name} — {best}")
+
+    my_rank = leaderboard.rank(player_class(), st.session_state.learner_id)
+    if my_rank:
+        st.markdown(f"📍 Your rank: **{my_rank}**")
+
+    stats = leaderboard.class_stats(player_class())
+    if stats["players"]:
+        st.caption(
+            f"{stats['players']} learners · average best score "
+            f"{stats['average_high_score']:.0f} · "
+            f"{stats['words_learned']} words learned together"
+        )
 
 
 # ---------------- TTS Playback ----------------
 def play_tts(text, slow=False):
+    gTTS = lazy_import("gtts").gTTS
     tts = gTTS(text=text, lang="en", slow=slow)
     mp3_fp = BytesIO()
     tts.write_to_fp(mp3_fp)
@@ -189,29 +355,27 @@ if st.session_state.mode in ["learn", "quiz"]:
 
 
 # ---------------- Achievements ----------------
-def check_achievements():
-    achieved = []
-    if (
-        st.session_state.streak >= 3
-        and "Streak Master" not in st.session_state.achievements
-    ):
-        st.session_state.achievements.append("Streak Master")
-        achieved.append("Streak Master")
-    if (
-        st.session_state.total_learned >= TOTAL_WORDS
-        and "Word Collector" not in st.session_state.achievements
-    ):
-        st.session_state.achievements.append("Word Collector")
-        achieved.append("Word Collector")
-    if achieved:
-        for a in achieved:
-            st.success(f"Achievement unlocked: {a}")
+# Each rule is only checked when the state it depends on changes
+achievement_rules = AchievementRules()
+achievement_rules.on("streak", "Streak Master", lambda s: s.streak >= 3)
+achievement_rules.on(
+    "learned", "Word Collector", lambda s: s.total_learned >= TOTAL_WORDS
+)
+
+
+def check_achievements(event):
+    achieved = achievement_rules.evaluate(
+        event, st.session_state, st.session_state.achievements
+    )
+    for a in achieved:
+        st.session_state.achievements.append(a)
+        st.success(f"Achievement unlocked: {a}")
 
 
 # ---------------- Pronunciation Practice ----------------
 def pronunciation_practice(word):
     try:
-        import speech_recognition as sr
+        sr = lazy_import("speech_recognition")
 
         recognizer = sr.Recognizer()
         with sr.Microphone() as source:
@@ -250,7 +414,7 @@ def review_mode():
     for i, word in enumerate(st.session_state.review_list):
         item = next(it for it in word_list if it["word"] == word)
         with st.expander(f"{item['word'].capitalize()}"):
-            st.image(item["image"], width=150)
+            st.image(asset(item["image"]), width=150)
 
             if "example" in item:
                 st.markdown(f"📖 *{item['example']}*")
@@ -361,13 +525,14 @@ if st.session_state.mode == "learn":
         st.markdown(f"🏁 Final Score: `{st.session_state.score}`")
         if st.button("Restart Game"):
             for key in list(st.session_state.keys()):
-                del st.session_state[key]
+                if key not in IDENTITY_KEYS:
+                    del st.session_state[key]
             st.rerun()
         st.stop()
 
     current = word_list[st.session_state.index]
     st.title("📘 Learn New Word")
-    st.image(current["image"], width=300)
+    st.image(asset(current["image"]), width=300)
     st.markdown(f"## ✏️ Word: **{current['word'].capitalize()}**")
 
     if "example" in current:
@@ -395,6 +560,9 @@ if st.session_state.mode == "learn":
                 st.session_state.learned_words.append(current["word"])
                 st.session_state.total_learned += 1
                 st.session_state.daily_learned += 1
+                st.session_state.adaptive.add(current["word"])
+                check_achievements("learned")
+                submit_score()
                 if current["word"] not in st.session_state.review_list:
                     st.session_state.review_list.append(current["word"])
 
@@ -438,13 +606,18 @@ elif st.session_state.mode == "quiz":
         st.markdown(f"🏁 Final Score: `{st.session_state.score}`")
         if st.button("Restart Game"):
             for key in list(st.session_state.keys()):
-                del st.session_state[key]
+                if key not in IDENTITY_KEYS:
+                    del st.session_state[key]
             st.rerun()
         st.stop()
 
     if st.session_state.quiz_correct_word is None:
-        correct = random.choice(st.session_state.learned_words)
+        # Weighted by past mistakes, so earlier missed words come back too
+        correct = st.session_state.adaptive.draw() or random.choice(
+            st.session_state.learned_words
+        )
         st.session_state.quiz_correct_word = correct
+        st.session_state.quiz_shown_at = time.time()
         all_words = [w["word"] for w in word_list if w["word"] != correct]
         distractors = random.sample(all_words, min(3, len(all_words)))
         options = [correct] + distractors
@@ -454,7 +627,7 @@ elif st.session_state.mode == "quiz":
     correct_item = next(
         w for w in word_list if w["word"] == st.session_state.quiz_correct_word
     )
-    st.image(correct_item["image"], width=300)
+    st.image(asset(correct_item["image"]), width=300)
     st.markdown("👉 Choose the correct word for this image:")
 
     if not st.session_state.quiz_submitted:
@@ -463,6 +636,11 @@ elif st.session_state.mode == "quiz":
             with cols[i]:
                 if st.button(opt.capitalize(), key=f"quiz_{i}_{opt}"):
                     st.session_state.selected_option = opt
+                    record_answer(
+                        st.session_state.quiz_correct_word,
+                        opt == st.session_state.quiz_correct_word,
+                        st.session_state.get("quiz_shown_at"),
+                    )
                     if opt == st.session_state.quiz_correct_word:
                         st.session_state.quiz_result = "correct"
                         st.session_state.score += 10
@@ -470,7 +648,8 @@ elif st.session_state.mode == "quiz":
                         st.session_state.high_score = max(
                             st.session_state.high_score, st.session_state.score
                         )
-                        check_achievements()
+                        check_achievements("streak")
+                        submit_score()
                     else:
                         st.session_state.quiz_result = "wrong"
                         st.session_state.streak = 0
@@ -531,10 +710,12 @@ elif st.session_state.mode == "input_quiz":
         st.session_state.input_quiz_state = "idle"
         st.session_state.input_quiz_show_hint = False
         st.session_state.input_quiz_answers = {}
+        st.session_state.input_quiz_shown_at = {}
 
         learned_words: List[Dict] = st.session_state.get("today_learned_words", [])
-        sampled_items = random.sample(learned_words, k=min(10, len(learned_words)))
-        st.session_state.input_quiz_list = [w["word"] for w in sampled_items]
+        st.session_state.input_quiz_list = st.session_state.adaptive.sample(
+            [w["word"] for w in learned_words], k=10
+        )
 
         st.session_state.input_quiz_initialized = True  # ✅ Flag initialized
 
@@ -555,7 +736,7 @@ elif st.session_state.mode == "input_quiz":
         st.rerun()
 
     st.title(f"⌨️ Daily Input Quiz {idx + 1}/{len(quiz_list)}")
-    st.image(item["image"], width=280)
+    st.image(asset(item["image"]), width=280)
     st.markdown("👉 Type the correct English word for this image:")
 
     # ------------------- Text Input -------------------
@@ -568,6 +749,7 @@ elif st.session_state.mode == "input_quiz":
         st.session_state["reset_input_quiz"] = False  # Reset Flag
 
     st.session_state.input_quiz_answers.setdefault(idx, "")
+    st.session_state.input_quiz_shown_at.setdefault(idx, time.time())
     user_input = st.text_input(
         "Your Answer:", value=st.session_state.input_quiz_answers[idx], key=input_key
     )
@@ -575,7 +757,11 @@ elif st.session_state.mode == "input_quiz":
 
     # ------------------- Submit -------------------
     if st.button("✅ Submit") and st.session_state.input_quiz_state == "idle":
-        if user_input.strip().lower() == current_word.lower():
+        is_correct = user_input.strip().lower() == current_word.lower()
+        record_answer(
+            current_word, is_correct, st.session_state.input_quiz_shown_at.get(idx)
+        )
+        if is_correct:
             st.session_state.input_quiz_results.append((current_word, True))
             st.session_state.input_quiz_score += 1
             st.session_state.input_quiz_state = "correct"
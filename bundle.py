@@ -0,0 +1,167 @@
+"""Single-file asset bundle for images and sounds.
+
+Layout (all integers little-endian):
+
+    header   magic b"EWGB", version u16, entry count u32
+    table    per entry: path length u16, path (utf-8), offset u64,
+             length u64, source mtime_ns i64, sha256 digest (32 bytes)
+    data     file contents; identical files (same digest) are stored once
+
+The reader memory-maps the bundle and serves each asset as a view into the
+map, so the app opens one file instead of one per image or sound.
+words.json is not bundled: it is edited by hand and always read from disk.
+
+    python bundle.py
+
+builds the bundle from images/ and sounds/ (generate_json.py does the same
+after updating words.json).
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+
+BUNDLE_FILE = "assets.bundle"
+ASSET_FOLDERS = ("images", "sounds")
+MAGIC = b"EWGB"
+VERSION = 2
+
+_HEADER = struct.Struct("<4sHI")
+_PATH_LEN = struct.Struct("<H")
+_ENTRY = struct.Struct("<QQq32s")
+
+
+def _normalize(path):
+    return os.path.normpath(path).replace("\\", "/")
+
+
+# ---------------- Builder ----------------
+def asset_paths(folders=ASSET_FOLDERS):
+    """Every file in the asset folders."""
+    paths = []
+    for folder in folders:
+        for name in os.listdir(folder):
+            path = os.path.join(folder, name)
+            if os.path.isfile(path):
+                paths.append(path)
+    return paths
+
+
+def build_bundle(paths, out_path=BUNDLE_FILE):
+    """Pack the given files into one bundle. Returns the number of entries."""
+    entries = []
+    blobs = {}
+    for path in sorted({_normalize(p) for p in paths}):
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = hashlib.sha256(data).digest()
+        blobs.setdefault(digest, data)
+        entries.append((path.encode("utf-8"), os.stat(path).st_mtime_ns, digest))
+
+    table_size = sum(_PATH_LEN.size + len(p) + _ENTRY.size for p, _, _ in entries)
+    offset = _HEADER.size + table_size
+    offsets = {}
+    for digest, data in blobs.items():
+        offsets[digest] = offset
+        offset += len(data)
+
+    # Write to a temp file first so a running app never maps a half-written bundle
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(entries)))
+        for path, mtime_ns, digest in entries:
+            f.write(_PATH_LEN.pack(len(path)))
+            f.write(path)
+            f.write(_ENTRY.pack(offsets[digest], len(blobs[digest]), mtime_ns, digest))
+        for data in blobs.values():
+            f.write(data)
+    os.replace(tmp_path, out_path)
+    return len(entries)
+
+
+# ---------------- Reader ----------------
+class AssetBundle:
+    """Read-only, memory-mapped view of a bundle built by build_bundle."""
+
+    def __init__(self, path=BUNDLE_FILE):
+        with open(path, "rb") as f:
+            # mmap raises ValueError itself for an empty file
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._index = self._read_index(path)
+        except ValueError:
+            self._map.close()
+            raise
+
+    def _unpack(self, fmt, pos, path):
+        # A truncated or partly copied bundle must fail as ValueError, not struct.error
+        if pos + fmt.size > len(self._map):
+            raise ValueError(f"{path} is truncated")
+        return fmt.unpack_from(self._map, pos)
+
+    def _read_index(self, path):
+        magic, version, count = self._unpack(_HEADER, 0, path)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} asset bundle")
+
+        index = {}
+        pos = _HEADER.size
+        for _ in range(count):
+            (name_len,) = self._unpack(_PATH_LEN, pos, path)
+            pos += _PATH_LEN.size
+            if pos + name_len > len(self._map):
+                raise ValueError(f"{path} is truncated")
+            try:
+                name = self._map[pos : pos + name_len].decode("utf-8")
+            except UnicodeDecodeError:
+                raise ValueError(f"{path} has a corrupt table") from None
+            pos += name_len
+            entry = self._unpack(_ENTRY, pos, path)
+            pos += _ENTRY.size
+            offset, length = entry[0], entry[1]
+            if offset + length > len(self._map):
+                raise ValueError(f"{path} is truncated ({name} is cut short)")
+            index[name] = entry
+        return index
+
+    def __contains__(self, path):
+        return _normalize(path) in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def read(self, path):
+        """Return a zero-copy memoryview of the file's bytes in the map."""
+        offset, length, _, _ = self._index[_normalize(path)]
+        return memoryview(self._map)[offset : offset + length]
+
+    def stale_paths(self):
+        """Bundled files whose copy on disk has changed since the build.
+
+        Only compares size and mtime (a stat, no reads). Files missing on
+        disk are fine: a deployment may ship the bundle alone.
+        """
+        stale = []
+        for name, (_, length, mtime_ns, _) in self._index.items():
+            try:
+                st = os.stat(name)
+            except OSError:
+                continue
+            if st.st_size != length or st.st_mtime_ns != mtime_ns:
+                stale.append(name)
+        return stale
+
+    def warm(self):
+        """Touch every page of the map so later reads don't hit the disk."""
+        for offset in range(0, len(self._map), mmap.PAGESIZE):
+            self._map[offset]
+
+    def close(self):
+        self._map.close()
+
+
+if __name__ == "__main__":
+    count = build_bundle(asset_paths())
+    size_mb = os.path.getsize(BUNDLE_FILE) / 1024 / 1024
+    print(f"📦 Asset bundle written to {BUNDLE_FILE}: {count} files, {size_mb:.1f} MB.")
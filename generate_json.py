@@ -1,5 +1,6 @@
 import os
 import json
+from bundle import BUNDLE_FILE, asset_paths, build_bundle
 
 # Path to the image folder
 image_folder = "images"
@@ -59,3 +60,7 @@ print(f"🆕 New words added in this run: {new_words_count}.")
 deduped = sorted(set(duplicate_in_upload))
 print(f"♻️  Duplicate image names detected and de-duplicated: {len(deduped)}" + (f" ({', '.join(deduped)})" if deduped else ""))
 
+# Pack images and sounds into one indexed asset bundle
+# (words.json stays a loose file so hand edits take effect without a rebuild)
+bundled_count = build_bundle(asset_paths(), BUNDLE_FILE)
+print(f"📦 Asset bundle written to {BUNDLE_FILE}: {bundled_count} files, {os.path.getsize(BUNDLE_FILE) / 1024 / 1024:.1f} MB.")
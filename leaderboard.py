@@ -0,0 +1,272 @@
+"""Class leaderboards shared by every session in the process.
+
+Scores are stored in SQLite (one row per learner) so they survive
+restarts. Rankings are served from an in-memory indexable skip list per
+class, kept up to date as scores change: submitting a score, top-K and
+rank-of-user are all O(log n) (plus K for top-K), with no re-sorting of
+the whole class on a request.
+
+The in-memory view belongs to one process. It is loaded from the
+database at startup and then only sees this process's own writes (and
+the rows those writes return), so several app processes sharing one
+database file do not see each other's new learners until they restart.
+"""
+
+import random
+import sqlite3
+import threading
+import time
+
+LEADERBOARD_DB = "leaderboard.db"
+MAX_LEVELS = 24
+
+
+# ---------------- Indexable Skip List ----------------
+class _Node:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key, levels):
+        self.key = key
+        self.next = [None] * levels
+        self.width = [1] * levels
+
+
+class SkipList:
+    """Sorted keys with O(log n) insert, remove and rank lookup.
+
+    Each link stores how many positions it skips, so the rank of a key is
+    the sum of the widths walked to reach it.
+    """
+
+    def __init__(self):
+        self.head = _Node(None, MAX_LEVELS)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        node = self.head.next[0]
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+    def _chain(self, key):
+        # Last node before key at every level, and its position in the list
+        chain = [None] * MAX_LEVELS
+        positions = [0] * MAX_LEVELS
+        node, pos = self.head, 0
+        for level in reversed(range(MAX_LEVELS)):
+            while node.next[level] is not None and node.next[level].key < key:
+                pos += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+            positions[level] = pos
+        return chain, positions
+
+    def insert(self, key):
+        chain, positions = self._chain(key)
+        levels = 1
+        while levels < MAX_LEVELS and random.random() < 0.5:
+            levels += 1
+
+        new = _Node(key, levels)
+        pos = positions[0] + 1
+        for level in range(MAX_LEVELS):
+            prev = chain[level]
+            if level < levels:
+                new.next[level] = prev.next[level]
+                new.width[level] = prev.width[level] - (pos - positions[level]) + 1
+                prev.next[level] = new
+                prev.width[level] = pos - positions[level]
+            else:
+                prev.width[level] += 1
+        self.size += 1
+
+    def remove(self, key):
+        chain, _ = self._chain(key)
+        target = chain[0].next[0]
+        if target is None or target.key != key:
+            raise KeyError(key)
+        for level in range(MAX_LEVELS):
+            prev = chain[level]
+            if level < len(target.next):
+                prev.width[level] += target.width[level] - 1
+                prev.next[level] = target.next[level]
+            else:
+                prev.width[level] -= 1
+        self.size -= 1
+
+    def rank(self, key):
+        """0-based position of key, or None if it is not in the list."""
+        chain, positions = self._chain(key)
+        found = chain[0].next[0]
+        if found is None or found.key != key:
+            return None
+        return positions[0]
+
+    def first(self, k):
+        result = []
+        node = self.head.next[0]
+        while node is not None and len(result) < k:
+            result.append(node.key)
+            node = node.next[0]
+        return result
+
+
+# ---------------- Leaderboard ----------------
+class Leaderboard:
+    """Per-class high scores with running class-wide totals.
+
+    Learners are keyed on a stable ID, so renaming or switching class
+    updates or moves their single row instead of adding a new one.
+    """
+
+    def __init__(self, db_path=LEADERBOARD_DB):
+        # lock guards the in-memory rankings; db_lock serializes writes, so
+        # readers never wait on a commit
+        self.lock = threading.Lock()
+        self.db_lock = threading.Lock()
+        self.db = sqlite3.connect(db_path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS learners (
+                learner_id TEXT PRIMARY KEY,
+                group_name TEXT NOT NULL,
+                name TEXT NOT NULL,
+                high_score INTEGER NOT NULL DEFAULT 0,
+                words_learned INTEGER NOT NULL DEFAULT 0,
+                updated_at INTEGER NOT NULL DEFAULT 0
+            )"""
+        )
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(learners)")}
+        if "updated_at" not in columns:
+            # Older databases: count existing rows as active from today
+            self.db.execute(
+                "ALTER TABLE learners ADD COLUMN updated_at INTEGER NOT NULL DEFAULT 0"
+            )
+            self.db.execute("UPDATE learners SET updated_at = ?", (int(time.time()),))
+        self.db.commit()
+
+        self.rankings = {}  # group -> SkipList of (-high_score, learner_id)
+        self.players = {}  # learner_id -> (group, name, high_score, words_learned)
+        self.totals = {}  # group -> [players, sum of high scores, words learned]
+        rows = self.db.execute(
+            "SELECT learner_id, group_name, name, high_score, words_learned "
+            "FROM learners"
+        )
+        for learner_id, *entry in rows:
+            self._apply(learner_id, tuple(entry))
+
+    def _unlink(self, learner_id):
+        group, _, high_score, words_learned = self.players.pop(learner_id)
+        self.rankings[group].remove((-high_score, learner_id))
+        totals = self.totals[group]
+        totals[0] -= 1
+        totals[1] -= high_score
+        totals[2] -= words_learned
+
+    def _apply(self, learner_id, entry):
+        if learner_id in self.players:
+            self._unlink(learner_id)
+        group, _, high_score, words_learned = entry
+        self.rankings.setdefault(group, SkipList()).insert((-high_score, learner_id))
+        totals = self.totals.setdefault(group, [0, 0, 0])
+        totals[0] += 1
+        totals[1] += high_score
+        totals[2] += words_learned
+        self.players[learner_id] = entry
+
+    def submit(self, learner_id, name, group, high_score, words_learned=0):
+        """Record a learner's progress under their current name and class.
+
+        Scores only ever go up in the database, so a process holding an
+        older copy cannot lower another process's write. The in-memory
+        entry is replaced with the row the database ends up with.
+        """
+        with self.lock:
+            old = self.players.get(learner_id)
+        if old is not None:
+            high_score = max(high_score, old[2])
+            words_learned = max(words_learned, old[3])
+            if (group, name, high_score, words_learned) == old:
+                return
+
+        with self.db_lock:
+            row = self.db.execute(
+                """INSERT INTO learners
+                    (learner_id, group_name, name, high_score, words_learned, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (learner_id) DO UPDATE SET
+                    group_name = excluded.group_name,
+                    name = excluded.name,
+                    high_score = MAX(learners.high_score, excluded.high_score),
+                    words_learned = MAX(learners.words_learned, excluded.words_learned),
+                    updated_at = excluded.updated_at
+                RETURNING group_name, name, high_score, words_learned""",
+                (learner_id, group, name, high_score, words_learned, int(time.time())),
+            ).fetchone()
+            self.db.commit()
+            # Still under db_lock, so two writes for one learner apply in order
+            with self.lock:
+                self._apply(learner_id, row)
+
+    def remove(self, learner_id):
+        """Take a learner off the leaderboard, e.g. after clearing their name."""
+        with self.db_lock:
+            with self.lock:
+                if learner_id not in self.players:
+                    return
+                self._unlink(learner_id)
+            self.db.execute("DELETE FROM learners WHERE learner_id = ?", (learner_id,))
+            self.db.commit()
+
+    def prune(self, max_age_seconds):
+        """Delete learners with no progress for max_age_seconds. Returns how many."""
+        cutoff = int(time.time()) - max_age_seconds
+        with self.db_lock:
+            removed = self.db.execute(
+                "DELETE FROM learners WHERE updated_at < ? RETURNING learner_id",
+                (cutoff,),
+            ).fetchall()
+            self.db.commit()
+            with self.lock:
+                for (learner_id,) in removed:
+                    if learner_id in self.players:
+                        self._unlink(learner_id)
+        return len(removed)
+
+    def player(self, learner_id):
+        """(class, name) a learner last submitted under, or None."""
+        with self.lock:
+            entry = self.players.get(learner_id)
+        return None if entry is None else entry[:2]
+
+    def top(self, group, k=10):
+        """The k best learners in a class as (name, high_score) pairs."""
+        with self.lock:
+            ranking = self.rankings.get(group)
+            if ranking is None:
+                return []
+            return [
+                (self.players[learner_id][1], -neg)
+                for neg, learner_id in ranking.first(k)
+            ]
+
+    def rank(self, group, learner_id):
+        """1-based rank of a learner in a class, or None if not in it."""
+        with self.lock:
+            entry = self.players.get(learner_id)
+            if entry is None or entry[0] != group:
+                return None
+            return self.rankings[group].rank((-entry[2], learner_id)) + 1
+
+    def class_stats(self, group):
+        with self.lock:
+            players, score_sum, words = self.totals.get(group, [0, 0, 0])
+        return {
+            "players": players,
+            "average_high_score": score_sum / players if players else 0,
+            "words_learned": words,
+        }
@@ -0,0 +1,347 @@
+"""Headless load test for app.py.
+
+Drives N simulated learners through a full session, using Streamlit's
+AppTest harness inside this process:
+
+    learn -> Next x3 -> quiz -> ... -> goal_completed -> input_quiz
+          -> input_quiz_summary -> review
+
+gTTS and speech_recognition are replaced with offline stubs so no network
+or microphone is needed, and the app's fixed UI pauses (time.sleep) are
+skipped. Each learner "thinks" for a random time between steps (--think),
+so the load offered to the process grows with the number of learners.
+One untimed session runs first so one-off costs (imports, caches) are not
+counted against the first level. Example:
+
+    python loadtest.py --users 8
+    python loadtest.py --ramp 1,2,4,8,16,32 --think 2-8
+
+AppTest swaps process-wide Streamlit state (the Runtime singleton and
+config) on every run, so reruns cannot overlap safely. The learners'
+sessions are interleaved, but only one rerun executes at a time. The
+numbers are therefore NOT a measure of real parallel serving: "service"
+time is the script's own cost per rerun, step latency adds the time
+spent queueing behind other learners, and utilisation is the share of
+wall time a rerun was executing. The knee is where utilisation nears
+100% and latency climbs. Because the script is mostly
+CPU-bound Python under the GIL, that queueing is a reasonable model of
+one app.py process, but network, websocket and browser costs are not
+included.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+import types
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_FILE = os.path.join(APP_DIR, "app.py")
+MAX_STEPS = 200
+
+# Only one AppTest run at a time (see module docstring)
+RUN_LOCK = threading.Lock()
+# Kept before main() disables time.sleep for the app's UI pauses
+REAL_SLEEP = time.sleep
+
+
+# ---------------- Offline Stubs ----------------
+def install_stubs():
+    gtts = types.ModuleType("gtts")
+
+    class gTTS:
+        def __init__(self, text, lang="en", slow=False):
+            self.text = text
+
+        def write_to_fp(self, fp):
+            fp.write(b"ID3")
+
+    gtts.gTTS = gTTS
+    sys.modules["gtts"] = gtts
+
+    sr = types.ModuleType("speech_recognition")
+
+    class Recognizer:
+        pass
+
+    def Microphone():
+        raise OSError("no microphone in load test")
+
+    sr.Recognizer = Recognizer
+    sr.Microphone = Microphone
+    sr.UnknownValueError = type("UnknownValueError", (Exception,), {})
+    sr.RequestError = type("RequestError", (Exception,), {})
+    sys.modules["speech_recognition"] = sr
+
+
+# ---------------- Simulated Learner ----------------
+class Learner:
+    def __init__(self, error_rate, timings, service_times, think=(0.0, 0.0)):
+        from streamlit.testing.v1 import AppTest
+
+        self.at = AppTest.from_file(APP_FILE, default_timeout=60)
+        self.error_rate = error_rate
+        self.think = think
+        self.timings = timings
+        self.service_times = service_times
+        self.steps = 0
+
+    @property
+    def mode(self):
+        return self.at.session_state["mode"]
+
+    def run(self, step, action=None):
+        if self.steps >= MAX_STEPS:
+            raise RuntimeError(f"gave up after {MAX_STEPS} steps in mode {self.mode}")
+        self.steps += 1
+        if action is not None and self.think[1] > 0:
+            # A learner reads the page before clicking; not part of latency
+            REAL_SLEEP(random.uniform(*self.think))
+        queued = time.perf_counter()
+        with RUN_LOCK:
+            start = time.perf_counter()
+            if action is None:
+                self.at.run()
+            else:
+                action.run()
+            end = time.perf_counter()
+        self.service_times.append(end - start)
+        self.timings[step].append(end - queued)
+        if self.at.exception:
+            raise RuntimeError(f"{step}: {self.at.exception[0].message}")
+
+    def button(self, label=None, key=None):
+        if key is not None:
+            return self.at.button(key=key)
+        return next(b for b in self.at.button if b.label == label)
+
+    def answers_right(self):
+        return random.random() >= self.error_rate
+
+    def session(self):
+        self.run("start")
+
+        while self.mode != "goal_completed":
+            if self.mode == "learn":
+                self.run("learn_next", self.button(key="next_word").click())
+            elif self.mode == "quiz":
+                self.quiz()
+            else:
+                raise RuntimeError(f"unexpected mode {self.mode}")
+
+        self.run("goal_completed", self.button("🧩 Start Daily Input Quiz").click())
+
+        while self.mode == "input_quiz":
+            self.input_quiz()
+
+        review = self.button("🔁 Review Missed Words").click()
+        self.run("summary_review", review)
+        if self.mode == "review":
+            back = self.button("🏁 Back to Quiz Summary").click()
+            self.run("review_back", back)
+
+    def quiz(self):
+        options = self.at.session_state["quiz_options"]
+        correct = self.at.session_state["quiz_correct_word"]
+        if self.answers_right():
+            choice = correct
+        else:
+            choice = random.choice([o for o in options if o != correct] or [correct])
+        i = options.index(choice)
+        self.run("quiz_answer", self.button(key=f"quiz_{i}_{choice}").click())
+        if self.mode == "quiz":
+            self.run("quiz_continue", self.button("➡️ Continue to next").click())
+
+    def input_quiz(self):
+        idx = self.at.session_state["input_quiz_idx"]
+        word = self.at.session_state["input_quiz_list"][idx]
+        answer = word if self.answers_right() else word[::-1] + "x"
+        self.at.text_input(key=f"input_quiz_text_{idx}").input(answer)
+        self.run("input_submit", self.button("✅ Submit").click())
+        if self.at.session_state["input_quiz_state"] == "correct":
+            self.run("input_continue", self.button("➡️ Continue").click())
+        else:
+            self.run("input_skip", self.button("➡️ Skip to Next").click())
+
+
+# ---------------- Load Levels ----------------
+def percentile(values, p):
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[p - 1]
+
+
+def run_level(users, error_rate, think, measure_memory):
+    timings = defaultdict(list)
+    service_times = []
+    failures = []
+
+    if measure_memory:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+    def one_session(_):
+        learner = Learner(error_rate, timings, service_times, think)
+        try:
+            learner.session()
+        except Exception as e:  # Keep going; failures are part of the report
+            failures.append(str(e))
+        return learner
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        learners = list(pool.map(one_session, range(users)))
+    elapsed = time.perf_counter() - start
+
+    mem_per_session = None
+    if measure_memory:
+        # Learners are still alive here, so their session state is counted
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        mem_per_session = (current - baseline) / users
+    del learners
+
+    return {
+        "users": users,
+        "elapsed": elapsed,
+        "sessions_per_s": (users - len(failures)) / elapsed,
+        "steps_per_s": sum(len(v) for v in timings.values()) / elapsed,
+        "timings": dict(timings),
+        "service_times": service_times,
+        "utilisation": sum(service_times) / elapsed,
+        "failures": failures,
+        "mem_per_session": mem_per_session,
+    }
+
+
+def print_level(result):
+    print(
+        f"\n=== {result['users']} interleaved learner(s): "
+        f"{result['elapsed']:.1f}s, "
+        f"{result['sessions_per_s']:.2f} sessions/s, "
+        f"{result['steps_per_s']:.1f} reruns/s"
+    )
+    service = result["service_times"]
+    if service:
+        print(
+            f"Script time per rerun: p50 {percentile(service, 50) * 1000:.0f} ms, "
+            f"p90 {percentile(service, 90) * 1000:.0f} ms "
+            "(step latencies below include queueing)"
+        )
+    print(f"Utilisation: {result['utilisation']:.0%} of wall time running reruns")
+    if result["mem_per_session"] is not None:
+        print(f"Memory per session: {result['mem_per_session'] / 1024:.0f} KiB")
+    print(f"{'step':<16}{'count':>7}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}")
+    for step, values in result["timings"].items():
+        print(
+            f"{step:<16}{len(values):>7}"
+            f"{percentile(values, 50) * 1000:>10.0f}"
+            f"{percentile(values, 90) * 1000:>10.0f}"
+            f"{percentile(values, 99) * 1000:>10.0f}"
+        )
+    if result["failures"]:
+        print(f"❌ {len(result['failures'])} failed session(s), first: {result['failures'][0]}")
+
+
+def p90_latency(result):
+    return percentile([t for v in result["timings"].values() for t in v], 90)
+
+
+def find_knee(results, target):
+    """Index of the first level whose p90 step latency is over target seconds."""
+    for i, result in enumerate(results):
+        if p90_latency(result) > target:
+            return i
+    return None
+
+
+def parse_think(value):
+    low, _, high = value.partition("-")
+    low = float(low)
+    return low, float(high) if high else low
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=4, help="simulated learners")
+    parser.add_argument(
+        "--ramp", help="comma-separated learner counts, e.g. 1,2,4,8,16"
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.2,
+        help="chance a simulated learner answers wrong",
+    )
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=1000,
+        help="p90 step latency that counts as overloaded when ramping",
+    )
+    parser.add_argument(
+        "--think",
+        type=parse_think,
+        default=(2.0, 8.0),
+        help="seconds a learner pauses before each click, e.g. 2-8 or 0",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip tracemalloc (it slows the run down)",
+    )
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    install_stubs()
+    # Fixed UI pauses would only measure the sleep, and hold RUN_LOCK while doing it
+    time.sleep = lambda seconds: None
+    # app.py opens words.json, images/ and sounds/ relative to the working dir
+    os.chdir(APP_DIR)
+
+    # Pay one-off costs (imports, cache_resource objects) outside the measurements
+    warm_up = Learner(args.error_rate, defaultdict(list), [])
+    try:
+        warm_up.session()
+    except Exception as e:
+        print(f"⚠️  Warm-up session failed: {e}")
+    del warm_up
+
+    levels = [int(n) for n in args.ramp.split(",")] if args.ramp else [args.users]
+    results = []
+    for users in levels:
+        result = run_level(users, args.error_rate, args.think, not args.no_memory)
+        print_level(result)
+        results.append(result)
+
+    if len(results) > 1:
+        print("\nusers  sessions/s  utilisation  p90 step ms")
+        for r in results:
+            print(
+                f"{r['users']:>5}  {r['sessions_per_s']:>10.2f}  "
+                f"{r['utilisation']:>11.0%}  {p90_latency(r) * 1000:>11.0f}"
+            )
+        knee = find_knee(results, args.target_ms / 1000)
+        if knee is None:
+            print(f"📈 p90 latency stays under {args.target_ms:.0f} ms at every level tested.")
+        elif knee == 0:
+            print(
+                f"📉 Already over {args.target_ms:.0f} ms p90 at the first level "
+                f"({results[0]['users']} learners); start the ramp lower."
+            )
+        else:
+            print(
+                f"📉 p90 latency passes {args.target_ms:.0f} ms between "
+                f"{results[knee - 1]['users']} and {results[knee]['users']} learners."
+            )
+
+
+if __name__ == "__main__":
+    main()
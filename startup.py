@@ -0,0 +1,189 @@
+"""Lazy imports, background warm-up and an import-time report.
+
+Heavy libraries (plotly, gTTS, speech_recognition) are only imported where
+they are used, so the first page renders without waiting for them. Run
+
+    python startup.py
+
+to time app.py's real top-level imports (read from the script itself) and
+each lazy library in a fresh interpreter, so startup regressions show up
+before they reach a deployment.
+"""
+
+import ast
+import importlib
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+
+# Libraries app.py loads lazily, in the order the warm-up thread imports them
+HEAVY_MODULES = ["plotly.graph_objects", "gtts", "speech_recognition"]
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+IMPORT_TIMES = {}
+logger = logging.getLogger(__name__)
+
+
+def lazy_import(name):
+    """Import a module on first use and remember how long it took."""
+    # import_module waits on the module's import lock, so a thread never
+    # sees a module another thread is still importing
+    already_loaded = name in sys.modules
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    if not already_loaded:
+        IMPORT_TIMES.setdefault(name, time.perf_counter() - start)
+    return module
+
+
+def warm_up(paths=(), bundle=None):
+    """Import heavy modules and load assets so the first click is fast.
+
+    With an asset bundle, its mapped pages are touched instead of reading
+    loose files.
+    """
+    start = time.perf_counter()
+    for name in HEAVY_MODULES:
+        try:
+            lazy_import(name)
+        except ImportError:
+            pass
+    if bundle is not None:
+        bundle.warm()
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                f.read()
+        except OSError:
+            pass
+
+    details = ", ".join(f"{n} {t:.2f}s" for n, t in IMPORT_TIMES.items())
+    logger.info("Warm-up finished in %.2fs (%s)", time.perf_counter() - start, details)
+
+
+def start_warm_up(paths=(), bundle=None):
+    thread = threading.Thread(target=warm_up, args=(paths, bundle), daemon=True)
+    thread.start()
+    return thread
+
+
+# ---------------- Import-Time Report ----------------
+def startup_imports(path=APP_FILE):
+    """The absolute import statements app.py runs at module level."""
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return [
+        node
+        for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+        and not getattr(node, "level", 0)
+    ]
+
+
+def imported_names(node):
+    if isinstance(node, ast.ImportFrom):
+        return [node.module]
+    return [alias.name for alias in node.names]
+
+
+def measure_startup(nodes, heavy=HEAVY_MODULES, cwd=None):
+    """Run app.py's top-level imports under -X importtime.
+
+    Returns (timings, loaded): (module, seconds) for each module imported
+    directly by those statements, slowest first, and the heavy modules
+    found in sys.modules afterwards, however deeply they were pulled in.
+    Returns None if the imports fail.
+    """
+    cwd = cwd or os.path.dirname(APP_FILE)
+    code = "\n".join(ast.unparse(node) for node in nodes)
+    code += (
+        "\nimport sys as _sys"
+        f"\nprint(','.join(m for m in {list(heavy)!r} if m in _sys.modules))"
+    )
+    result = _importtime(code, cwd)
+    if result is None:
+        return None
+    timings, stdout = result
+    lines = stdout.strip().splitlines()
+    loaded = [m for m in lines[-1].split(",") if m] if lines else []
+
+    # Drop what the interpreter itself loads before running any code
+    interpreter = {name for name, _ in (_importtime("pass", cwd) or ([], ""))[0]}
+    timings = [(name, t) for name, t in timings if name not in interpreter]
+    return sorted(timings, key=lambda t: t[1], reverse=True), loaded
+
+
+def _importtime(code, cwd):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+    )
+    if result.returncode != 0:
+        return None
+
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Nested imports are indented; keep the top-level ones
+        if not name.startswith("  "):
+            timings.append((name.strip(), int(cumulative) / 1e6))
+    return timings, result.stdout
+
+
+def measure_import(name):
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {name}; print(time.perf_counter() - t)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    nodes = startup_imports()
+    eager = {name for node in nodes for name in imported_names(node)}
+
+    print("Startup imports (module level in app.py):")
+    measured = measure_startup(nodes)
+    loaded = []
+    if measured is None:
+        print("  ❌ app.py's imports failed; install requirements.txt first")
+    else:
+        timings, loaded = measured
+        for name, seconds in timings:
+            print(f"  {name:<28}{seconds:>7.2f}s")
+        print(f"  {'total':<28}{sum(t for _, t in timings):>7.2f}s")
+
+    print("\nLazy imports (first use):")
+    for name in HEAVY_MODULES:
+        seconds = measure_import(name)
+        shown = f"{seconds:.2f}s" if seconds is not None else "missing"
+        print(f"  {name:<28}{shown:>8}")
+
+    # Direct imports in app.py, plus anything those imports pulled in
+    regressions = [
+        name
+        for name in HEAVY_MODULES
+        if name in loaded or name.split(".")[0] in {e.split(".")[0] for e in eager}
+    ]
+    if regressions:
+        print(f"\n⚠️  Imported at startup but meant to be lazy: {', '.join(regressions)}")
+        sys.exit(1)
+    if measured is None:
+        # Indirect imports could not be checked
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
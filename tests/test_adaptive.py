@@ -0,0 +1,98 @@
+import random
+
+import pytest
+
+from adaptive import AdaptiveSampler, FenwickTree
+
+
+def brute_find(values, target):
+    acc = 0.0
+    for i, v in enumerate(values):
+        acc += v
+        if acc > target:
+            return i
+    return len(values) - 1
+
+
+@pytest.mark.parametrize("capacity", [0, 1, 3, 5, 16, 17])
+@pytest.mark.parametrize("count", [1, 5, 16, 17, 40])
+def test_fenwick_matches_prefix_sums(capacity, count):
+    tree = FenwickTree(capacity)
+    values = [float(i + 1) for i in range(count)]
+    for v in values:
+        tree.append(v)
+    assert tree.total() == sum(values)
+    for target in [0.0, 0.5] + [sum(values[:i]) for i in range(1, count)]:
+        assert tree.find(target) == brute_find(values, target)
+
+
+def test_fenwick_update_after_grow():
+    rng = random.Random(1)
+    tree = FenwickTree(1)
+    values = []
+    for _ in range(50):
+        values.append(rng.random())
+        tree.append(values[-1])
+        i = rng.randrange(len(values))
+        values[i] = rng.random()
+        tree.update(i, values[i])
+        assert tree.total() == pytest.approx(sum(values))
+        target = rng.random() * sum(values)
+        assert tree.find(target) == brute_find(values, target)
+
+
+def test_missed_words_are_drawn_more():
+    random.seed(0)
+    sampler = AdaptiveSampler()
+    for word in "abcd":
+        sampler.add(word)
+    for _ in range(5):
+        sampler.record("a", False)
+        for word in "bcd":
+            sampler.record(word, True)
+    draws = [sampler.draw() for _ in range(1000)]
+    assert draws.count("a") > 500
+
+
+def test_class_misses_raise_other_learners_weights():
+    class_stats = AdaptiveSampler()
+    learner = AdaptiveSampler(class_stats)
+    other = AdaptiveSampler(class_stats)
+    learner.add("apple")
+    before = learner.weight("apple")
+    for _ in range(5):
+        other.record("apple", False)
+    # Nothing is pushed to other learners; they catch up when they draw
+    assert learner.weight("apple") == before
+    learner.draw()
+    assert learner.weight("apple") > before
+
+
+def test_learner_catches_up_after_change_log_overflows(monkeypatch):
+    monkeypatch.setattr("adaptive.CHANGE_LOG_SIZE", 4)
+    class_stats = AdaptiveSampler()
+    learner = AdaptiveSampler(class_stats)
+    other = AdaptiveSampler(class_stats)
+    learner.add("apple")
+    before = learner.weight("apple")
+    other.record("apple", False)
+    for _ in range(10):
+        other.record("pear", True)
+    learner.refresh_class_prior()
+    assert learner.weight("apple") > before
+
+
+def test_own_answers_do_not_count_twice():
+    alone = AdaptiveSampler()
+    in_class = AdaptiveSampler(AdaptiveSampler())
+    for sampler in (alone, in_class):
+        for _ in range(4):
+            sampler.record("apple", False)
+        sampler.refresh_class_prior()
+    assert in_class.weight("apple") == pytest.approx(alone.weight("apple"))
+
+
+def test_sample_returns_distinct_words():
+    sampler = AdaptiveSampler()
+    picked = sampler.sample(["a", "b", "b", "c"], k=10)
+    assert sorted(picked) == ["a", "b", "c"]
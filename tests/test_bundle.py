@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from bundle import AssetBundle, build_bundle
+
+
+@pytest.fixture
+def assets(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.mkdir("images")
+    os.mkdir("sounds")
+    files = {
+        "images/apple.png": b"\x89PNG apple",
+        "images/black raspberry.png": b"\x89PNG raspberry",
+        "sounds/correct.mp3": b"ID3 same",
+        "sounds/wrong.mp3": b"ID3 same",
+    }
+    for path, data in files.items():
+        with open(path, "wb") as f:
+            f.write(data)
+    return files
+
+
+def test_round_trip(assets):
+    assert build_bundle(assets, "assets.bundle") == len(assets)
+    bundle = AssetBundle("assets.bundle")
+    assert len(bundle) == len(assets)
+    for path, data in assets.items():
+        assert path in bundle
+        view = bundle.read(path)
+        assert isinstance(view, memoryview)
+        assert view.tobytes() == data
+    assert "images/missing.png" not in bundle
+
+
+def test_identical_files_stored_once(assets):
+    build_bundle(assets, "assets.bundle")
+    size = os.path.getsize("assets.bundle")
+    build_bundle([p for p in assets if p != "sounds/wrong.mp3"], "other.bundle")
+    # Only the table entry is extra, not a second copy of the data
+    assert size - os.path.getsize("other.bundle") < 100
+
+
+def test_stale_paths(assets):
+    build_bundle(assets, "assets.bundle")
+    bundle = AssetBundle("assets.bundle")
+    assert bundle.stale_paths() == []
+
+    os.remove("images/apple.png")  # shipped without loose files: not stale
+    with open("sounds/wrong.mp3", "wb") as f:
+        f.write(b"ID3 edited after the build")
+    assert bundle.stale_paths() == ["sounds/wrong.mp3"]
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not.bundle"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        AssetBundle(str(path))
+
+
+@pytest.mark.parametrize("keep", [0, 7, 20, 60])
+def test_truncated_bundle_raises_value_error(assets, keep):
+    build_bundle(assets, "assets.bundle")
+    with open("assets.bundle", "rb") as f:
+        data = f.read()
+    with open("cut.bundle", "wb") as f:
+        f.write(data[:keep])
+    with pytest.raises(ValueError):
+        AssetBundle("cut.bundle")
+
+
+def test_bundle_with_data_cut_short_raises_value_error(assets):
+    build_bundle(assets, "assets.bundle")
+    with open("assets.bundle", "rb") as f:
+        data = f.read()
+    with open("cut.bundle", "wb") as f:
+        f.write(data[:-3])
+    with pytest.raises(ValueError, match="cut short"):
+        AssetBundle("cut.bundle")
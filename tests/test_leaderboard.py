@@ -0,0 +1,97 @@
+import random
+import time
+
+from leaderboard import Leaderboard, SkipList
+
+
+def test_skip_list_matches_sorted_list():
+    rng = random.Random(0)
+    skip, ref = SkipList(), []
+    for _ in range(3000):
+        if ref and rng.random() < 0.4:
+            key = rng.choice(ref)
+            ref.remove(key)
+            skip.remove(key)
+        else:
+            key = (-rng.randint(0, 100), str(rng.random()))
+            ref.append(key)
+            skip.insert(key)
+        ref.sort()
+        assert len(skip) == len(ref)
+        if ref:
+            key = rng.choice(ref)
+            assert skip.rank(key) == ref.index(key)
+        assert skip.first(3) == ref[:3]
+    assert list(skip) == ref
+    assert skip.rank((1, "missing")) is None
+
+
+def test_top_rank_and_class_stats(tmp_path):
+    board = Leaderboard(str(tmp_path / "lb.db"))
+    board.submit("a", "Amy", "7B", 30, 5)
+    board.submit("b", "Bob", "7B", 50, 9)
+    board.submit("a", "Amy", "7B", 20, 6)  # lower score does not replace the best
+    board.submit("c", "Cy", "7C", 10)
+
+    assert board.top("7B") == [("Bob", 50), ("Amy", 30)]
+    assert board.rank("7B", "a") == 2
+    assert board.rank("7C", "a") is None
+    assert board.class_stats("7B") == {
+        "players": 2,
+        "average_high_score": 40,
+        "words_learned": 15,
+    }
+
+
+def test_rename_and_class_change_move_one_row(tmp_path):
+    board = Leaderboard(str(tmp_path / "lb.db"))
+    board.submit("a", "Amy", "7B", 30)
+    board.submit("a", "Amelia", "7B", 30)
+    assert board.top("7B") == [("Amelia", 30)]
+
+    board.submit("a", "Amelia", "7C", 30)
+    assert board.top("7B") == []
+    assert board.class_stats("7B")["players"] == 0
+    assert board.rank("7C", "a") == 1
+
+    board.remove("a")
+    assert board.top("7C") == []
+    assert Leaderboard(str(tmp_path / "lb.db")).top("7C") == []
+
+
+def test_same_learner_from_new_process_updates_one_row(tmp_path):
+    path = str(tmp_path / "lb.db")
+    Leaderboard(path).submit("a", "Sam", "7B", 30)
+    board = Leaderboard(path)
+    assert board.player("a") == ("7B", "Sam")
+    board.submit("a", "Sam", "7B", 40)
+    assert Leaderboard(path).top("7B") == [("Sam", 40)]
+
+
+def test_prune_removes_inactive_learners(tmp_path, monkeypatch):
+    path = str(tmp_path / "lb.db")
+    board = Leaderboard(path)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now - 100 * 86400)
+    board.submit("old", "Old", "7B", 80, 3)
+    monkeypatch.setattr(time, "time", lambda: now)
+    board.submit("new", "New", "7B", 20, 1)
+
+    assert board.prune(90 * 86400) == 1
+    assert board.top("7B") == [("New", 20)]
+    assert board.class_stats("7B")["words_learned"] == 1
+    assert board.player("old") is None
+    assert Leaderboard(path).top("7B") == [("New", 20)]
+
+
+def test_stale_process_cannot_lower_score(tmp_path):
+    path = str(tmp_path / "lb.db")
+    first, second = Leaderboard(path), Leaderboard(path)
+    first.submit("a", "Amy", "7B", 30, 5)
+    second.submit("a", "Amy", "7B", 90, 12)
+    first.submit("a", "Amy", "7B", 40, 6)
+    # first picks up the row its write ended up with
+    assert first.top("7B") == [("Amy", 90)]
+    assert first.class_stats("7B")["words_learned"] == 12
+    assert Leaderboard(path).top("7B") == [("Amy", 90)]
+    assert Leaderboard(path).class_stats("7B")["words_learned"] == 12
@@ -0,0 +1,47 @@
+import sys
+import threading
+import time
+
+from startup import lazy_import, measure_startup, startup_imports
+
+
+def test_lazy_import_waits_for_module_being_imported(tmp_path, monkeypatch):
+    (tmp_path / "slow_module.py").write_text(
+        "import time\ntime.sleep(0.5)\nFigure = object\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "slow_module", raising=False)
+
+    first = threading.Thread(target=lazy_import, args=("slow_module",))
+    first.start()
+    time.sleep(0.1)
+    module = lazy_import("slow_module")
+    first.join()
+    assert hasattr(module, "Figure")
+
+
+def test_startup_imports_reads_module_level_imports(tmp_path):
+    app = tmp_path / "app.py"
+    app.write_text(
+        "import json\nimport plotly.graph_objects as go\n\n"
+        "def f():\n    import gtts\n"
+    )
+    names = [ast_node_name(node) for node in startup_imports(str(app))]
+    assert names == ["json", "plotly.graph_objects"]
+
+
+def ast_node_name(node):
+    return node.names[0].name
+
+
+def test_measure_startup_sees_heavy_modules_imported_indirectly(tmp_path):
+    (tmp_path / "fake_heavy.py").write_text("")
+    (tmp_path / "leak.py").write_text("import fake_heavy\n")
+    app = tmp_path / "app.py"
+    app.write_text("import json\nimport leak\n")
+
+    timings, loaded = measure_startup(
+        startup_imports(str(app)), heavy=["fake_heavy", "gtts"], cwd=str(tmp_path)
+    )
+    assert loaded == ["fake_heavy"]
+    assert "leak" in [name for name, _ in timings]